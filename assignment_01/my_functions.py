@@ -16,13 +16,474 @@
 ##################################################
 """
 
+##################################################
+# Import Modules.
+##################################################
+
+import csv
+import json
+import math
+import zlib
+from array import array
+from collections import namedtuple, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+# NumPy is optional: lists use the pure-Python loops below
+# and arrays are dispatched to vectorized reductions.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+##################################################
+# Vectorized Backend
+##################################################
+
+# Number of elements reduced at a time by the vectorized kernels,
+# which bounds their temporary arrays for large or memory-mapped input.
+_BLOCK_SIZE = 1 << 20
+
+
+def _as_vector(x):
+    """
+    Returns x as a one-dimensional numeric ndarray if x is 
+    an ndarray, a pandas Series or any object supporting 
+    the buffer protocol, such as memoryview, array.array or np.memmap.
+    Returns None for lists, tuples and when NumPy is not installed,
+    so that the pure-Python path is taken.
+    
+    Numeric input is viewed without copying; the kernels convert 
+    it to float64 one block of _BLOCK_SIZE elements at a time. 
+    
+    """
+    
+    if np is None or isinstance(x, (list, tuple)):
+        return None
+    if hasattr(x, 'to_numpy'):
+        x = x.to_numpy()
+    elif not isinstance(x, np.ndarray):
+        try:
+            memoryview(x)
+        except TypeError:
+            return None
+    x = np.asarray(x)
+    if x.dtype.kind not in 'biuf':
+        x = x.astype(np.float64)
+    return x.reshape(-1)
+
+
+##################################################
+# Moment Accumulator
+##################################################
+
+# Series of statistics over a rolling window.
+RollingStats = namedtuple('RollingStats', ['variance_x', 'covariance',
+                                           'slope', 'intercept'])
+
+# Out-of-sample errors from cross validation.
+LeaveOneOut = namedtuple('LeaveOneOut', ['residuals', 'press'])
+KFold = namedtuple('KFold', ['fold_ssr', 'press'])
+
+# Bootstrap distribution of the slope coefficient.
+Bootstrap = namedtuple('Bootstrap', ['slopes', 'se'])
+
+# Result of a bivariate regression fit.
+OLSFit = namedtuple('OLSFit', ['beta_0', 'beta_1', 'ssr', 'r_squared',
+                               'se_beta_0', 'se_beta_1', 'n'])
+
+
+class MomentAccumulator:
+    """
+    Accumulates the count, means and co-moments of
+    paired observations y and x in a single pass.
+    
+    Observations can be added one at a time with update(),
+    a list at a time with update_batch(), 
+    and accumulators built from separate chunks of data
+    can be combined with merge(). 
+    
+    >>> acc = MomentAccumulator()
+    >>> acc.update_batch([102, 106, 88], [101, 103, 94])
+    >>> acc.update(104, 102)
+    >>> other = MomentAccumulator()
+    >>> other.update(100, 100)
+    >>> acc.merge(other)
+    >>> acc.n
+    5
+    >>> round(acc.variance_x(), 10)
+    12.5
+    >>> round(acc.slope(), 10)
+    2.0
+    >>> round(acc.intercept(), 10)
+    -100.0
+    
+    """
+    
+    def __init__(self):
+        self.n = 0
+        self.x_bar = 0.0
+        self.y_bar = 0.0
+        self.m_xx = 0.0
+        self.m_yy = 0.0
+        self.c_xy = 0.0
+    
+    def update(self, y, x, w=1):
+        """
+        Add a single observation (y, x) to the accumulator, 
+        counted w times. An observation with weight 0 is ignored.
+        """
+        
+        if w == 0:
+            return
+        self.n = self.n + w
+        dx = x - self.x_bar
+        dy = y - self.y_bar
+        self.x_bar = self.x_bar + dx*w/self.n
+        self.y_bar = self.y_bar + dy*w/self.n
+        self.m_xx = self.m_xx + w*dx*(x - self.x_bar)
+        self.m_yy = self.m_yy + w*dy*(y - self.y_bar)
+        self.c_xy = self.c_xy + w*dx*(y - self.y_bar)
+    
+    def remove(self, y, x):
+        """Remove a previously added observation (y, x) from the accumulator."""
+        
+        n = self.n - 1
+        if n == 0:
+            self.__init__()
+            return
+        x_bar = self.x_bar - (x - self.x_bar)/n
+        y_bar = self.y_bar - (y - self.y_bar)/n
+        self.m_xx = self.m_xx - (x - x_bar)*(x - self.x_bar)
+        self.m_yy = self.m_yy - (y - y_bar)*(y - self.y_bar)
+        self.c_xy = self.c_xy - (x - x_bar)*(y - self.y_bar)
+        self.x_bar = x_bar
+        self.y_bar = y_bar
+        self.n = n
+    
+    def update_batch(self, y, x, w=None):
+        """
+        Add the observations in the lists y and x to the accumulator,
+        each counted by the frequency weight in the list w, if given.
+        """
+        
+        if len(x) == 0:
+            return
+        
+        x_vec = _as_vector(x)
+        y_vec = x_vec if y is x else _as_vector(y)
+        w_vec = None if w is None else _as_vector(w)
+        if (x_vec is not None and y_vec is not None 
+                and (w is None or w_vec is not None)):
+            for start in range(0, len(x_vec), _BLOCK_SIZE):
+                stop = start + _BLOCK_SIZE
+                x_block = x_vec[start:stop].astype(np.float64, copy=False)
+                if y_vec is x_vec:
+                    y_block = x_block
+                else:
+                    y_block = y_vec[start:stop].astype(np.float64, copy=False)
+                if w_vec is None:
+                    w_block = None
+                else:
+                    w_block = w_vec[start:stop].astype(np.float64, copy=False)
+                self.merge(_vector_moments(y_block, x_block, w_block))
+            return
+        
+        if w is None:
+            n = len(x)
+            x_bar = sum(x)/n
+            y_bar = sum(y)/n
+        else:
+            n = sum(w)
+            if n == 0:
+                return
+            x_bar = sum(w[i]*x[i] for i in range(len(x)))/n
+            y_bar = sum(w[i]*y[i] for i in range(len(y)))/n
+        
+        m_xx = 0
+        m_yy = 0
+        c_xy = 0
+        for i in range(0, len(x)):
+            dx = x[i] - x_bar
+            dy = y[i] - y_bar
+            if w is None:
+                m_xx = m_xx + dx**2
+                m_yy = m_yy + dy**2
+                c_xy = c_xy + dy*dx
+            else:
+                m_xx = m_xx + w[i]*dx**2
+                m_yy = m_yy + w[i]*dy**2
+                c_xy = c_xy + w[i]*dy*dx
+        
+        batch = MomentAccumulator()
+        batch.n = n
+        batch.x_bar = x_bar
+        batch.y_bar = y_bar
+        batch.m_xx = m_xx
+        batch.m_yy = m_yy
+        batch.c_xy = c_xy
+        self.merge(batch)
+    
+    def merge(self, other):
+        """Combine the moments of another accumulator into this one."""
+        
+        if other.n == 0:
+            return
+        if self.n == 0:
+            self.n = other.n
+            self.x_bar = other.x_bar
+            self.y_bar = other.y_bar
+            self.m_xx = other.m_xx
+            self.m_yy = other.m_yy
+            self.c_xy = other.c_xy
+            return
+        
+        n = self.n + other.n
+        dx = other.x_bar - self.x_bar
+        dy = other.y_bar - self.y_bar
+        weight = self.n*other.n/n
+        self.x_bar = self.x_bar + dx*other.n/n
+        self.y_bar = self.y_bar + dy*other.n/n
+        self.m_xx = self.m_xx + other.m_xx + dx*dx*weight
+        self.m_yy = self.m_yy + other.m_yy + dy*dy*weight
+        self.c_xy = self.c_xy + other.c_xy + dx*dy*weight
+        self.n = n
+    
+    def _degrees_of_freedom(self):
+        """
+        Return n - 1, the divisor of the sample moments, 
+        or raise ValueError if there are fewer than two observations.
+        """
+        
+        if self.n <= 1:
+            raise ValueError('At least two observations are needed '
+                             + 'for a sample variance or covariance.')
+        return self.n - 1
+    
+    def variance_x(self):
+        """Return the sample variance of x."""
+        return self.m_xx/self._degrees_of_freedom()
+    
+    def variance_y(self):
+        """Return the sample variance of y."""
+        return self.m_yy/self._degrees_of_freedom()
+    
+    def covariance(self):
+        """Return the sample covariance of y and x."""
+        return self.c_xy/self._degrees_of_freedom()
+    
+    def slope(self):
+        """Return the OLS slope coefficient of y on x."""
+        return self.covariance()/self.variance_x()
+    
+    def intercept(self):
+        """Return the OLS intercept coefficient of y on x."""
+        return self.y_bar - self.slope()*self.x_bar
+    
+    def ssr(self, beta_0, beta_1):
+        """
+        Return the sum of squared residuals at coefficients 
+        beta_0 and beta_1, which may be numbers or 
+        NumPy arrays of matching shapes, 
+        from the closed-form quadratic in the accumulated moments.
+        """
+        
+        gap = self.y_bar - beta_0 - beta_1*self.x_bar
+        return (self.m_yy - 2*beta_1*self.c_xy + beta_1**2*self.m_xx
+                + self.n*gap**2)
+    
+    def fit(self):
+        """
+        Return an OLSFit with the coefficients, SSR, R-squared
+        and standard errors implied by the accumulated moments.
+        """
+        
+        n = self.n
+        beta_1 = self.c_xy/self.m_xx
+        beta_0 = self.y_bar - beta_1*self.x_bar
+        ssr = max(self.m_yy - beta_1*self.c_xy, 0.0)
+        if self.m_yy > 0:
+            r_squared = 1.0 - ssr/self.m_yy
+        else:
+            r_squared = float('nan')
+        if n > 2:
+            sigma_sq = ssr/(n - 2)
+            se_beta_1 = math.sqrt(sigma_sq/self.m_xx)
+            se_beta_0 = math.sqrt(sigma_sq*(1/n + self.x_bar**2/self.m_xx))
+        else:
+            se_beta_0 = float('nan')
+            se_beta_1 = float('nan')
+        return OLSFit(beta_0, beta_1, ssr, r_squared, se_beta_0, se_beta_1, n)
+
+
+def _vector_moments(y, x, w=None):
+    """
+    Returns a MomentAccumulator for the float ndarrays y and x,
+    with optional frequency weights w,
+    computed with vectorized reductions. 
+    """
+    
+    acc = MomentAccumulator()
+    if w is None:
+        acc.n = len(x)
+        acc.x_bar = float(x.mean())
+        dx = x - acc.x_bar
+        w_dx = dx
+    else:
+        acc.n = float(w.sum())
+        if acc.n == 0:
+            return MomentAccumulator()
+        acc.x_bar = float(w @ x)/acc.n
+        dx = x - acc.x_bar
+        w_dx = w*dx
+    acc.m_xx = float(w_dx @ dx)
+    if y is x:
+        acc.y_bar = acc.x_bar
+        acc.m_yy = acc.m_xx
+        acc.c_xy = acc.m_xx
+    else:
+        if w is None:
+            acc.y_bar = float(y.mean())
+        else:
+            acc.y_bar = float(w @ y)/acc.n
+        dy = y - acc.y_bar
+        acc.m_yy = float((dy if w is None else w*dy) @ dy)
+        acc.c_xy = float(w_dx @ dy)
+    return acc
+
+
+##################################################
+# Moment Cache
+##################################################
+
+# The cache is off unless enable_moment_cache() is called.
+_moment_cache = None
+_moment_cache_max_size = 0
+_moment_cache_hits = 0
+_moment_cache_misses = 0
+
+
+def enable_moment_cache(max_size=128):
+    """
+    Turns on memoization of the moments computed by variance, 
+    covariance, ols_slope, ols_intercept and ols_fit, 
+    keeping the max_size most recently used data pairs. 
+    
+    Entries are keyed by a fingerprint of each input:
+    its identity, its length and a checksum of all of its elements, 
+    so data modified in place gets new moments. 
+    The checksum is much cheaper than the moments themselves, 
+    so repeated calls on unchanged data skip most of the work. 
+    
+    >>> enable_moment_cache(max_size=2)
+    >>> y, x = [102, 106, 88, 104, 100], [101, 103, 94, 102, 100]
+    >>> covariance(y, x)
+    25.0
+    >>> ols_slope(y, x)
+    2.0
+    >>> ols_intercept(y, x, 2.0)
+    -100.0
+    >>> moment_cache_info()
+    {'hits': 2, 'misses': 1, 'size': 1, 'max_size': 2}
+    >>> x[3] = 120
+    >>> covariance(y, x)
+    43.0
+    >>> disable_moment_cache()
+
+    """
+    
+    global _moment_cache, _moment_cache_max_size
+    _moment_cache = OrderedDict()
+    _moment_cache_max_size = max_size
+    clear_moment_cache()
+
+
+def disable_moment_cache():
+    """Turns off memoization of moments and discards the cache."""
+    
+    global _moment_cache
+    _moment_cache = None
+
+
+def clear_moment_cache():
+    """Discards all cached moments and resets the hit counts."""
+    
+    global _moment_cache_hits, _moment_cache_misses
+    if _moment_cache is not None:
+        _moment_cache.clear()
+    _moment_cache_hits = 0
+    _moment_cache_misses = 0
+
+
+def moment_cache_info():
+    """Returns a dictionary of cache hits, misses, size and max_size."""
+    
+    size = 0 if _moment_cache is None else len(_moment_cache)
+    return {'hits': _moment_cache_hits, 'misses': _moment_cache_misses,
+            'size': size, 'max_size': _moment_cache_max_size}
+
+
+def _fingerprint(x):
+    """
+    Returns a key for x made of its identity, its length 
+    and a checksum of all of its elements: 
+    a CRC-32 of the raw bytes of arrays, read a block at a time, 
+    or the hash of the tuple of the elements of a list.
+    """
+    
+    n = len(x)
+    x_vec = _as_vector(x)
+    if x_vec is None:
+        return (id(x), n, hash(tuple(x)))
+    
+    checksum = 0
+    for start in range(0, n, _BLOCK_SIZE):
+        block = np.ascontiguousarray(x_vec[start:start + _BLOCK_SIZE])
+        checksum = zlib.crc32(block, checksum)
+    return (id(x), n, x_vec.dtype.str, checksum)
+
+
+def _moments(y, x, w=None):
+    """
+    Returns the MomentAccumulator of y and x with optional weights w, 
+    from the cache when it is enabled and holds this data. 
+    The accumulator returned must not be modified. 
+    """
+    
+    global _moment_cache_hits, _moment_cache_misses
+    if _moment_cache is None:
+        acc = MomentAccumulator()
+        acc.update_batch(y, x, w)
+        return acc
+    
+    x_key = _fingerprint(x)
+    y_key = x_key if y is x else _fingerprint(y)
+    key = (y_key, x_key, None if w is None else _fingerprint(w))
+    acc = _moment_cache.get(key)
+    if acc is not None:
+        _moment_cache_hits = _moment_cache_hits + 1
+        _moment_cache.move_to_end(key)
+        return acc
+    
+    _moment_cache_misses = _moment_cache_misses + 1
+    acc = MomentAccumulator()
+    acc.update_batch(y, x, w)
+    _moment_cache[key] = acc
+    if len(_moment_cache) > _moment_cache_max_size:
+        _moment_cache.popitem(last=False)
+    return acc
+
+
 ##################################################
 # Part a) Variance
 ##################################################
 
-def variance(x):
+def variance(x, w=None):
     """
     Calculates the variance of a list x.
+    If a list of frequency weights w is given, 
+    each x[i] is counted w[i] times.
     
     Some examples are given below but you need to add some 
     that result in the answers given.
@@ -33,17 +494,22 @@ def variance(x):
     1.2
     >>> variance([4,4,4,4])
     0.0
+    >>> variance(np.array([101, 103, 94, 102, 100]))
+    12.5
+    >>> variance([99, 101], w=[3, 3])
+    1.2
+    >>> variance(array('d', [101, 103, 94, 102, 100]))
+    12.5
+    >>> variance([])
+    Traceback (most recent call last):
+    ...
+    ValueError: At least two observations are needed for a sample variance or covariance.
     
     """
     
-    n = len(x) # Modify this line.
-    x_bar = sum(x)/n # Modify this line.
-    
-    var = 0 # Modify this line.
-    for i in range(0, n):
-        var = var + (x[i] - x_bar)**2
+    acc = _moments(x, x, w)
     
-    var = var/(n-1)
+    var = acc.variance_x()
     return var
 
 
@@ -51,9 +517,11 @@ def variance(x):
 # Part b) Covariance
 ##################################################
 
-def covariance(y, x):
+def covariance(y, x, w=None):
     """
     Calculates the covariance of two lists y and x.
+    If a list of frequency weights w is given, 
+    each pair (y[i], x[i]) is counted w[i] times.
     
     Some examples are given below but you need to add some 
     that result in the answers given.
@@ -67,18 +535,17 @@ def covariance(y, x):
     >>> covariance([23,23,23,23], \
                    [5,7,43,700])
     0.0
+    >>> covariance([99, 101], [98, 102], w=[3, 3])
+    2.4
+    >>> covariance(memoryview(array('d', [99, 101, 99, 101])), \
+                   memoryview(array('d', [98, 102, 98, 102])))
+    2.6666666666666665
     
     """
     
-    n = len(x) # Modify this line.
-    x_bar = sum(x)/n # Modify this line.
-    y_bar = sum(y)/n # Modify this line.
-    
-    var = 0 # Modify this line.
-    for i in range(0, n):
-        var = var + (y[i] - y_bar)*(x[i] - x_bar)
+    acc = _moments(y, x, w)
     
-    var = var/(n-1)
+    var = acc.covariance()
     return var
 
 
@@ -87,12 +554,14 @@ def covariance(y, x):
 # Part c) Slope Coefficient
 ##################################################
 
-def ols_slope(y, x):
+def ols_slope(y, x, w=None):
     """
     Calculates the slope coefficient 
     by ordinary least squares
     for the linear regesssion model 
     between two lists y and x.
+    If a list of frequency weights w is given, 
+    each pair (y[i], x[i]) is counted w[i] times.
     
     The examples are given below but you need to fill in the answers.
     
@@ -104,27 +573,150 @@ def ols_slope(y, x):
     >>> ols_slope([99,101,99,101,99,101], \
                   [99,101,99,101,99,101])
     1.0
+    >>> ols_slope([2, -2], [-1, 1], w=[2, 2])
+    -2.0
     
     """
     
  
-    covar = covariance(y, x) # Modify this line.
-    var = variance(x) # Modify this line.
+    acc = _moments(y, x, w)
     
-    slope = covar/var # Modify this line.
+    slope = acc.slope()
     
     return slope
 
+def ols_slope_bootstrap(y, x, n_boot=10000, batch_size=500, 
+                        seed=None, n_jobs=1):
+    """Calculates the bootstrap distribution of the OLS slope 
+    coefficient from n_boot resamples of the pairs (y, x)
+    and its standard error. 
+    
+    Each batch of resamples is drawn as a (rows x n) 
+    matrix of multinomial counts, and the slopes of the whole batch 
+    are computed with matrix products of the counts and 
+    the centered data. The number of rows is batch_size, 
+    reduced for large n so that a batch holds at most 
+    max(n, _BLOCK_SIZE) counts per process. 
+    Every batch has its own seed spawned from seed, so the result 
+    is the same for any n_jobs; with n_jobs greater than 1 
+    the batches are computed in worker processes.
+    Resamples in which every x is the same have no slope; 
+    their slopes are nan and are left out of the standard error.
+    Requires NumPy.
+    
+    >>> boot = ols_slope_bootstrap([102, 106, 88, 104, 100], 
+    ...                            [101, 103, 94, 102, 100], 
+    ...                            n_boot=200, seed=42)
+    >>> boot.slopes.shape
+    (200,)
+    >>> round(boot.se, 10)
+    0.0
+    >>> boot_2 = ols_slope_bootstrap([2, 4, 5, 4, 5], [1, 2, 3, 4, 5], 
+    ...                              n_boot=300, batch_size=64, seed=1)
+    >>> boot_3 = ols_slope_bootstrap([2, 4, 5, 4, 5], [1, 2, 3, 4, 5], 
+    ...                              n_boot=300, batch_size=64, seed=1, 
+    ...                              n_jobs=2)
+    >>> bool(np.array_equal(boot_2.slopes, boot_3.slopes, equal_nan=True))
+    True
+    >>> boot_4 = ols_slope_bootstrap([1, 2, 3], [1, 1, 2], 
+    ...                              n_boot=2000, seed=0)
+    >>> bool(np.isinf(boot_4.slopes).any()), bool(np.isnan(boot_4.se))
+    (False, False)
+    >>> ols_slope_bootstrap([1, 2, 3], [1, 1, 2], n_boot=0)
+    Traceback (most recent call last):
+    ...
+    ValueError: n_boot must be at least 2 for a standard error.
+
+    """
+    
+    if np is None:
+        raise ImportError('ols_slope_bootstrap requires NumPy.')
+    
+    if n_boot < 2:
+        raise ValueError('n_boot must be at least 2 for a standard error.')
+    if batch_size < 1:
+        raise ValueError('batch_size must be at least 1.')
+    
+    x = np.asarray(x, dtype=np.float64).reshape(-1)
+    y = np.asarray(y, dtype=np.float64).reshape(-1)
+    batch_size = min(batch_size, max(1, _BLOCK_SIZE//max(len(x), 1)))
+    n_batches = -(-n_boot//batch_size)
+    sizes = [min(batch_size, n_boot - j*batch_size) for j in range(n_batches)]
+    seeds = np.random.SeedSequence(seed).spawn(n_batches)
+    
+    if n_jobs > 1:
+        with ProcessPoolExecutor(max_workers=n_jobs, 
+                                 initializer=_init_bootstrap_worker, 
+                                 initargs=(y, x)) as pool:
+            batches = list(pool.map(_bootstrap_batch, sizes, seeds))
+    else:
+        _init_bootstrap_worker(y, x)
+        try:
+            batches = [_bootstrap_batch(size, seed_seq) 
+                       for size, seed_seq in zip(sizes, seeds)]
+        finally:
+            _clear_bootstrap_data()
+    
+    slopes = np.concatenate(batches)
+    return Bootstrap(slopes, float(np.nanstd(slopes, ddof=1)))
+
+
+# Centered data shared by the bootstrap batches in each process.
+_bootstrap_data = None
+
+# Resamples whose variance of x is at most this fraction of 
+# the variance of the full sample have no defined slope.
+_BOOTSTRAP_RTOL = 1e-10
+
+
+def _init_bootstrap_worker(y, x):
+    """Stores the centered data and their products for _bootstrap_batch."""
+    
+    global _bootstrap_data
+    x_dev = x - x.mean()
+    y_dev = y - y.mean()
+    _bootstrap_data = np.column_stack([x_dev, y_dev, x_dev*x_dev, x_dev*y_dev])
+
+
+def _clear_bootstrap_data():
+    """Releases the data stored by _init_bootstrap_worker."""
+    
+    global _bootstrap_data
+    _bootstrap_data = None
+
+
+def _bootstrap_batch(size, seed_seq):
+    """
+    Returns the OLS slopes of size resamples, drawn as 
+    multinomial counts with the generator seeded by seed_seq. 
+    The slope is nan for resamples in which x is constant, 
+    up to rounding error.
+    """
+    
+    n = _bootstrap_data.shape[0]
+    rng = np.random.default_rng(seed_seq)
+    counts = rng.multinomial(n, np.full(n, 1/n), size=size)
+    sums = (counts @ _bootstrap_data)/n
+    var_x = sums[:, 2] - sums[:, 0]**2
+    tol = _BOOTSTRAP_RTOL*_bootstrap_data[:, 2].mean()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slopes = (sums[:, 3] - sums[:, 0]*sums[:, 1])/var_x
+    slopes[var_x <= tol] = np.nan
+    return slopes
+
+
 ##################################################
 # Part d) Intercept
 ##################################################
 
-def ols_intercept(y, x, beta_1_hat):
+def ols_intercept(y, x, beta_1_hat, w=None):
     """
     Calculates the intercept coefficient 
     by ordinary least squares
     for the linear regesssion model 
     between two lists y and x.
+    If a list of frequency weights w is given, 
+    each pair (y[i], x[i]) is counted w[i] times.
     
     The examples are given below but you need to fill in the answers.
     
@@ -136,14 +728,26 @@ def ols_intercept(y, x, beta_1_hat):
     >>> ols_intercept([99,101,99,101,99,101], \
                   [99,101,99,101,99,101], 1.0)
     0.0
+    >>> ols_intercept([2, -2], [-1, 1], -2.0, w=[2, 2])
+    0.0
     
     """
     
-    n = len(x) # Modify this line.
-    x_bar = sum(x)/n # Modify this line.
-    y_bar = sum(y)/n # Modify this line.
+    x_vec = _as_vector(x)
+    y_vec = _as_vector(y)
+    if _moment_cache is not None or w is not None:
+        acc = _moments(y, x, w)
+        x_bar = acc.x_bar
+        y_bar = acc.y_bar
+    elif x_vec is not None and y_vec is not None:
+        x_bar = float(x_vec.mean(dtype=np.float64))
+        y_bar = float(y_vec.mean(dtype=np.float64))
+    else:
+        n = len(x)
+        x_bar = sum(x)/n
+        y_bar = sum(y)/n
     
-    intercept = y_bar - beta_1_hat*x_bar # Modify this line.
+    intercept = y_bar - beta_1_hat*x_bar
     return intercept
     
 
@@ -151,11 +755,13 @@ def ols_intercept(y, x, beta_1_hat):
 # Part e) Sum of Squared Residuals
 ##################################################
 
-def ssr(y, x, beta_0, beta_1):
+def ssr(y, x, beta_0, beta_1, w=None):
     """Calculates the sum of squared residuals for 
     the bivariate linear regression model.
     y and x are lists of equal length
     and beta_0 and beta_1 are numeric coefficients of type float. 
+    If a list of frequency weights w is given, 
+    each squared residual is counted w[i] times.
     
     The examples are already filled out below.
     
@@ -165,13 +771,36 @@ def ssr(y, x, beta_0, beta_1):
     9.0
     >>> ssr([2, 3, 4], [1, 2, 3], 1.0, 1.0)
     0.0
+    >>> ssr([3, 0], [0, 2], 1.0, 0.5, w=[2, 1])
+    12.0
 
     """
     
+    x_vec = _as_vector(x)
+    y_vec = _as_vector(y)
+    w_vec = None if w is None else _as_vector(w)
+    if (x_vec is not None and y_vec is not None 
+            and (w is None or w_vec is not None)):
+        ssr = 0.0
+        for start in range(0, len(x_vec), _BLOCK_SIZE):
+            stop = start + _BLOCK_SIZE
+            residuals = (y_vec[start:stop].astype(np.float64, copy=False)
+                         - beta_0 
+                         - beta_1*x_vec[start:stop].astype(np.float64, 
+                                                          copy=False))
+            if w is None:
+                ssr = ssr + float(residuals @ residuals)
+            else:
+                ssr = ssr + float((w_vec[start:stop]*residuals) @ residuals)
+        return ssr
+    
     ssr = 0
     for i in range(len(y)):
         residual = y[i] - beta_0 - beta_1 * x[i]
-        ssr = ssr + residual** 2
+        if w is None:
+            ssr = ssr + residual** 2
+        else:
+            ssr = ssr + w[i]*residual** 2
     
     return ssr
 
@@ -180,6 +809,697 @@ def ssr(y, x, beta_0, beta_1):
 
 
 
+def ssr_grid(y, x, beta_0, beta_1):
+    """Calculates the sum of squared residuals 
+    for every pair of coefficients on the grid formed by 
+    the sequences beta_0 and beta_1. 
+    
+    Returns an array of shape (len(beta_0), len(beta_1)). 
+    The data are scanned once and each grid point is evaluated 
+    from the sufficient statistics, 
+    so the cost of the grid does not depend on the length of y.
+    Requires NumPy.
+    
+    >>> ssr_grid([3, 0, 3], [0, 2, 2], [0.0, 1.0], [0.5, 1.0]).round(10)
+    array([[14., 14.],
+           [ 9., 13.]])
+
+    """
+    
+    if np is None:
+        raise ImportError('ssr_grid requires NumPy.')
+    
+    acc = MomentAccumulator()
+    acc.update_batch(y, x)
+    beta_0, beta_1 = np.meshgrid(np.asarray(beta_0, dtype=np.float64),
+                                 np.asarray(beta_1, dtype=np.float64),
+                                 indexing='ij')
+    return acc.ssr(beta_0, beta_1)
+
+
+def compress(y, x):
+    """Collapses duplicated pairs (y[i], x[i]) into 
+    lists of the distinct values of y and x and 
+    the number of times each pair occurs, 
+    which can be passed as the weights w 
+    to variance, covariance, ols_slope, ols_intercept and ssr. 
+    Arrays are compressed with NumPy and returned as arrays. 
+    
+    >>> y_values, x_values, counts = compress([1, 0, 1, 1, 0], 
+    ...                                       [1, 0, 1, 1, 1])
+    >>> y_values, x_values, counts
+    ([1, 0, 0], [1, 0, 1], [3, 1, 1])
+    >>> round(ols_slope([1, 0, 1, 1, 0], [1, 0, 1, 1, 1]), 10)
+    0.75
+    >>> round(ols_slope(y_values, x_values, counts), 10)
+    0.75
+
+    """
+    
+    x_vec = _as_vector(x)
+    y_vec = _as_vector(y)
+    if x_vec is not None and y_vec is not None:
+        pairs, counts = np.unique(np.column_stack([y_vec, x_vec]), 
+                                  axis=0, return_counts=True)
+        return pairs[:, 0], pairs[:, 1], counts
+    
+    counts = {}
+    for pair in zip(y, x):
+        counts[pair] = counts.get(pair, 0) + 1
+    
+    y_values = [pair[0] for pair in counts]
+    x_values = [pair[1] for pair in counts]
+    return y_values, x_values, list(counts.values())
+
+
+##################################################
+# Part f) Fused Regression Fit
+##################################################
+
+def ols_fit(y, x, n_jobs=1):
+    """Estimates the bivariate linear regression model
+    of y on x by ordinary least squares
+    and returns an OLSFit with both coefficients, 
+    the sum of squared residuals, R-squared and 
+    the standard errors of the coefficients. 
+    
+    All quantities come from one pass over the data, 
+    rather than chaining ols_slope, ols_intercept and ssr. 
+    
+    With n_jobs greater than 1, the data are copied once into 
+    shared memory and split into n_jobs blocks, 
+    each reduced to a MomentAccumulator in a worker process. 
+    The partial moments are combined in the parent with 
+    MomentAccumulator.merge, which is the exact pairwise formula, 
+    so the result agrees with the serial fit up to rounding. 
+    Requires NumPy.
+    
+    >>> fit = ols_fit([3, 0, 3], [0, 2, 2])
+    >>> round(fit.beta_0, 10), round(fit.beta_1, 10)
+    (3.0, -0.75)
+    >>> fit.ssr
+    4.5
+    >>> fit.r_squared
+    0.25
+    >>> round(fit.se_beta_1, 4)
+    1.299
+    >>> ols_fit([102, 106, 88, 104, 100], \
+                [101, 103, 94, 102, 100]).ssr
+    0.0
+    >>> fit = ols_fit([3, 0, 3], [0, 2, 2], n_jobs=2)
+    >>> round(fit.beta_0, 10), round(fit.beta_1, 10), round(fit.ssr, 10)
+    (3.0, -0.75, 4.5)
+
+    """
+    
+    if n_jobs > 1:
+        return _parallel_moments(y, x, n_jobs).fit()
+    
+    return _moments(y, x).fit()
+
+
+def _shared_block_moments(shm_name, n, start, stop):
+    """
+    Worker for _parallel_moments: attaches to the shared 
+    (2, n) block of x and y and returns the MomentAccumulator 
+    of the observations from start to stop. 
+    """
+    
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        data = np.ndarray((2, n), dtype=np.float64, buffer=shm.buf)
+        acc = _vector_moments(data[1, start:stop], data[0, start:stop])
+        del data
+    finally:
+        shm.close()
+    return acc
+
+
+def _parallel_moments(y, x, n_jobs):
+    """
+    Returns the MomentAccumulator of y and x computed 
+    by n_jobs worker processes over a shared-memory copy of the data. 
+    """
+    
+    if np is None:
+        raise ImportError('Parallel fitting requires NumPy.')
+    
+    n = len(x)
+    shm = shared_memory.SharedMemory(create=True, size=max(2*n*8, 1))
+    try:
+        data = np.ndarray((2, n), dtype=np.float64, buffer=shm.buf)
+        data[0] = x
+        data[1] = y
+        del data
+        
+        bounds = [n*j//n_jobs for j in range(n_jobs + 1)]
+        with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+            futures = [pool.submit(_shared_block_moments, shm.name, n,
+                                   bounds[j], bounds[j + 1])
+                       for j in range(n_jobs) if bounds[j] < bounds[j + 1]]
+            acc = MomentAccumulator()
+            for future in futures:
+                acc.merge(future.result())
+    finally:
+        shm.close()
+        shm.unlink()
+    return acc
+
+
+##################################################
+# Part g) Many Regressions on One Regressor
+##################################################
+
+def ols_fit_many(Y, x):
+    """Estimates k bivariate regressions of each column 
+    of the n-by-k array Y on the same regressor x.
+    
+    The mean and variance of x are computed once and 
+    all k regressions are estimated in a single matrix pass. 
+    Returns an OLSFit whose fields are arrays of length k.
+    Requires NumPy.
+    
+    >>> Y = np.array([[102, 3], [106, 0], [88, 3], [104, 1], [100, 2]])
+    >>> fit = ols_fit_many(Y, [101, 103, 94, 102, 100])
+    >>> fit.beta_1.round(10)
+    array([ 2.  , -0.26])
+    >>> fit.beta_0.round(10)
+    array([-100. ,   27.8])
+    >>> fit.ssr.round(10)
+    array([0.  , 3.42])
+
+    """
+    
+    if np is None:
+        raise ImportError('ols_fit_many requires NumPy.')
+    
+    Y = np.asarray(Y, dtype=np.float64)
+    if Y.ndim == 1:
+        Y = Y.reshape(-1, 1)
+    x = np.asarray(x, dtype=np.float64).reshape(-1)
+    n = len(x)
+    
+    x_bar = float(x.mean())
+    dx = x - x_bar
+    m_xx = float(dx @ dx)
+    
+    y_bar = Y.mean(axis=0)
+    Y_dev = Y - y_bar
+    c_xy = dx @ Y_dev
+    m_yy = np.einsum('ij,ij->j', Y_dev, Y_dev)
+    
+    beta_1 = c_xy/m_xx
+    beta_0 = y_bar - beta_1*x_bar
+    ssr = np.maximum(m_yy - beta_1*c_xy, 0.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        r_squared = np.where(m_yy > 0, 1.0 - ssr/m_yy, np.nan)
+    if n > 2:
+        sigma_sq = ssr/(n - 2)
+        se_beta_1 = np.sqrt(sigma_sq/m_xx)
+        se_beta_0 = np.sqrt(sigma_sq*(1/n + x_bar**2/m_xx))
+    else:
+        se_beta_0 = np.full(Y.shape[1], np.nan)
+        se_beta_1 = np.full(Y.shape[1], np.nan)
+    return OLSFit(beta_0, beta_1, ssr, r_squared, se_beta_0, se_beta_1, n)
+
+
+##################################################
+# Part h) Rolling Window Statistics
+##################################################
+
+# Windows whose sum of squared deviations of x is at most this 
+# fraction of n*x_bar**2 have constant x, up to the rounding left 
+# by adding and removing observations.
+_ROLLING_RTOL = 1e-10
+
+
+def rolling_stats(y, x, window, min_periods=None):
+    """Calculates the variance of x, the covariance of y and x 
+    and the OLS slope and intercept over a rolling window
+    of the last window observations, in one pass over y and x.
+    
+    Each step adds the newest observation to a MomentAccumulator 
+    and removes the one leaving the window, so the cost per step
+    does not depend on the window length. 
+    Returns a RollingStats of lists with one entry per observation; 
+    entries with fewer than min_periods observations 
+    (default: window) are nan. In windows where x is constant, 
+    the variance and covariance are 0.0 and the slope and intercept 
+    are nan.
+    
+    >>> stats = rolling_stats([2, 4, 5, 4, 5], [1, 2, 3, 4, 5], 3)
+    >>> stats.variance_x
+    [nan, nan, 1.0, 1.0, 1.0]
+    >>> [round(b, 10) for b in stats.slope]
+    [nan, nan, 1.5, 0.0, 0.0]
+    >>> [round(b, 10) for b in stats.intercept]
+    [nan, nan, 0.6666666667, 4.3333333333, 4.6666666667]
+    >>> stats = rolling_stats([1, 2, 3, 4], 
+    ...                       [3e5, 1e5 + 0.1, 1e5 + 0.1, 1e5 + 0.1], 3)
+    >>> stats.variance_x[-1], stats.slope[-1]
+    (0.0, nan)
+
+    """
+    
+    if min_periods is None:
+        min_periods = window
+    min_periods = max(min_periods, 2)
+    
+    nan = float('nan')
+    result = RollingStats([], [], [], [])
+    acc = MomentAccumulator()
+    for i in range(len(x)):
+        acc.update(y[i], x[i])
+        if i >= window:
+            acc.remove(y[i - window], x[i - window])
+        
+        if acc.n >= min_periods:
+            if acc.m_xx > _ROLLING_RTOL*acc.n*acc.x_bar**2:
+                result.variance_x.append(acc.variance_x())
+                result.covariance.append(acc.covariance())
+                result.slope.append(acc.slope())
+                result.intercept.append(acc.intercept())
+            else:
+                result.variance_x.append(0.0)
+                result.covariance.append(0.0)
+                result.slope.append(nan)
+                result.intercept.append(nan)
+        else:
+            result.variance_x.append(nan)
+            result.covariance.append(nan)
+            result.slope.append(nan)
+            result.intercept.append(nan)
+    
+    return result
+
+
+##################################################
+# Part i) Out-of-Core Regression
+##################################################
+
+def ols_fit_chunks(chunks):
+    """Estimates the bivariate linear regression model 
+    from an iterator of row chunks, where each chunk is 
+    a list of (y, x) rows, such as the output of 
+    read_csv_chunks or fetch_chunks. 
+    
+    Only one chunk is held in memory at a time: 
+    each is folded into a MomentAccumulator and discarded, 
+    so the result matches ols_fit on the full data. 
+    
+    >>> chunks = [[(102, 101), (106, 103)], [(88, 94), (104, 102)], 
+    ...           [(100, 100)]]
+    >>> fit = ols_fit_chunks(iter(chunks))
+    >>> round(fit.beta_0, 10), round(fit.beta_1, 10)
+    (-100.0, 2.0)
+
+    """
+    
+    acc = MomentAccumulator()
+    for chunk in chunks:
+        if len(chunk) == 0:
+            continue
+        y, x = zip(*chunk)
+        acc.update_batch(y, x)
+    return acc.fit()
+
+
+def read_csv_chunks(file_name, y_name, x_name, chunk_size=100000):
+    """Reads the columns y_name and x_name from a CSV file 
+    with a header row and yields lists of at most chunk_size 
+    (y, x) rows of floats. 
+    
+    >>> import os, tempfile
+    >>> file_name = os.path.join(tempfile.mkdtemp(), 'sales.csv')
+    >>> with open(file_name, 'w') as csv_file:
+    ...     _ = csv_file.write('age,price\\n0,3\\n2,0\\n2,3\\n')
+    >>> list(read_csv_chunks(file_name, 'price', 'age', chunk_size=2))
+    [[(3.0, 0.0), (0.0, 2.0)], [(3.0, 2.0)]]
+    >>> ols_fit_chunks(read_csv_chunks(file_name, 'price', 'age', 2)).ssr
+    4.5
+
+    """
+    
+    with open(file_name, newline='') as csv_file:
+        reader = csv.reader(csv_file)
+        header = next(reader)
+        y_col = header.index(y_name)
+        x_col = header.index(x_name)
+        
+        chunk = []
+        for row in reader:
+            chunk.append((float(row[y_col]), float(row[x_col])))
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+
+def read_csv_arrays(file_name, names, typecode='d'):
+    """Reads the numeric columns in the list names from a CSV file 
+    with a header row into a dictionary of typed arrays, 
+    array.array(typecode), keyed by column name. 
+    
+    Typed arrays store 8 bytes per value for typecode 'd' 
+    (4 bytes for 'f') instead of a pointer to a float object,
+    and can be passed directly to variance, covariance, 
+    ols_slope, ols_intercept and ssr.
+    
+    >>> import os, tempfile
+    >>> file_name = os.path.join(tempfile.mkdtemp(), 'sales.csv')
+    >>> with open(file_name, 'w') as csv_file:
+    ...     _ = csv_file.write('age,price\\n101,102\\n103,106\\n94,88\\n')
+    >>> data = read_csv_arrays(file_name, ['price', 'age'])
+    >>> data['age']
+    array('d', [101.0, 103.0, 94.0])
+    >>> ols_slope(data['price'], data['age'])
+    2.0
+
+    """
+    
+    columns = {name: array(typecode) for name in names}
+    with open(file_name, newline='') as csv_file:
+        reader = csv.reader(csv_file)
+        header = next(reader)
+        positions = [(header.index(name), columns[name]) for name in names]
+        for row in reader:
+            for position, column in positions:
+                column.append(float(row[position]))
+    return columns
+
+
+def fetch_chunks(cursor, chunk_size=100000):
+    """Yields lists of at most chunk_size rows 
+    from a database cursor that has executed a query, 
+    such as SELECT price, age FROM Sales on airplanes.db. 
+    
+    >>> import sqlite3
+    >>> con = sqlite3.connect(':memory:')
+    >>> cur = con.cursor()
+    >>> cur.execute('CREATE TABLE Sales(age REAL, price REAL)') # doctest: +ELLIPSIS
+    <sqlite3.Cursor object at ...>
+    >>> cur.executemany('INSERT INTO Sales VALUES (?, ?)', 
+    ...                 [(0, 3), (2, 0), (2, 3)]) # doctest: +ELLIPSIS
+    <sqlite3.Cursor object at ...>
+    >>> cur.execute('SELECT price, age FROM Sales') # doctest: +ELLIPSIS
+    <sqlite3.Cursor object at ...>
+    >>> ols_fit_chunks(fetch_chunks(cur, 2)).ssr
+    4.5
+
+    """
+    
+    while True:
+        chunk = cursor.fetchmany(chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
+
+##################################################
+# Part j) Cross Validation
+##################################################
+
+# Observations whose leverage is within this distance of 1 
+# have no leave-one-out residual.
+_LEVERAGE_TOL = 1e-10
+
+
+def _leverage_error(i):
+    """Returns the ValueError for observation i having leverage 1."""
+    
+    return ValueError('Observation ' + str(i) + ' has leverage 1: '
+                      + 'without it the other x values are all equal, '
+                      + 'so its leave-one-out residual is undefined.')
+
+
+def ols_loo(y, x):
+    """Calculates the leave-one-out residuals of the 
+    bivariate linear regression model and their sum of squares, 
+    the prediction error sum of squares (PRESS). 
+    
+    Instead of refitting n times, the model is fit once and 
+    each residual is divided by one minus its leverage
+    h_i = 1/n + (x_i - x_bar)**2/sum((x - x_bar)**2).
+    Returns a LeaveOneOut with a list of residuals 
+    (an array for array input) and the PRESS statistic. 
+    Raises ValueError if some observation has leverage 1, 
+    which happens when all the other x values are equal, 
+    for example whenever n = 2.
+    
+    >>> loo = ols_loo([2, 4, 5, 4, 5], [1, 2, 3, 4, 5])
+    >>> [round(e, 10) for e in loo.residuals]
+    [-2.0, 0.8571428571, 1.25, -0.8571428571, -0.5]
+    >>> round(loo.press, 10)
+    7.2818877551
+    >>> ols_loo([1, 2, 3, 4], [0, 0, 0, 1])
+    Traceback (most recent call last):
+    ...
+    ValueError: Observation 3 has leverage 1: without it the other x values are all equal, so its leave-one-out residual is undefined.
+
+    """
+    
+    acc = _moments(y, x)
+    beta_1 = acc.slope()
+    beta_0 = acc.y_bar - beta_1*acc.x_bar
+    
+    x_vec = _as_vector(x)
+    y_vec = _as_vector(y)
+    if x_vec is not None and y_vec is not None:
+        leverage = 1/acc.n + (x_vec - acc.x_bar)**2/acc.m_xx
+        i = int(np.argmax(leverage))
+        if 1 - leverage[i] <= _LEVERAGE_TOL:
+            raise _leverage_error(i)
+        residuals = (y_vec - beta_0 - beta_1*x_vec)/(1 - leverage)
+        return LeaveOneOut(residuals, float(residuals @ residuals))
+    
+    residuals = []
+    press = 0
+    for i in range(acc.n):
+        leverage = 1/acc.n + (x[i] - acc.x_bar)**2/acc.m_xx
+        if 1 - leverage <= _LEVERAGE_TOL:
+            raise _leverage_error(i)
+        residual = (y[i] - beta_0 - beta_1*x[i])/(1 - leverage)
+        residuals.append(residual)
+        press = press + residual**2
+    return LeaveOneOut(residuals, press)
+
+
+def ols_kfold(y, x, k):
+    """Calculates the out-of-sample sum of squared residuals
+    of the bivariate linear regression model 
+    for each of k contiguous folds of the data, 
+    along with their total.
+    
+    The data are scanned once to build a MomentAccumulator 
+    per fold. Each training fit merges the other folds' moments 
+    and each test SSR is evaluated from the held-out fold's moments,
+    so no fold is rescanned. 
+    Returns a KFold with the list of fold SSRs and their sum.
+    
+    >>> cv = ols_kfold([2, 4, 5, 4, 5, 7], [1, 2, 3, 4, 5, 6], 3)
+    >>> [round(e, 10) for e in cv.fold_ssr]
+    [0.89, 1.6626297578, 0.89]
+    >>> round(cv.press, 10)
+    3.4426297578
+
+    """
+    
+    n = len(x)
+    bounds = [n*j//k for j in range(k + 1)]
+    folds = []
+    for j in range(k):
+        fold = MomentAccumulator()
+        fold.update_batch(y[bounds[j]:bounds[j + 1]],
+                          x[bounds[j]:bounds[j + 1]])
+        folds.append(fold)
+    
+    fold_ssr = []
+    for j in range(k):
+        train = MomentAccumulator()
+        for i in range(k):
+            if i != j:
+                train.merge(folds[i])
+        beta_1 = train.slope()
+        beta_0 = train.y_bar - beta_1*train.x_bar
+        if folds[j].n > 0:
+            fold_ssr.append(folds[j].ssr(beta_0, beta_1))
+        else:
+            fold_ssr.append(0.0)
+    
+    return KFold(fold_ssr, sum(fold_ssr))
+
+
+##################################################
+# Part k) Recursive Least Squares
+##################################################
+
+class RecursiveLeastSquares:
+    """
+    Updates the OLS coefficients and the sum of squared residuals
+    of the bivariate linear regression model 
+    as each new observation arrives, in constant time per observation.
+    
+    With forgetting less than 1, the weight of every past 
+    observation is multiplied by forgetting at each update, 
+    so the coefficients track a drifting relationship; 
+    forgetting=1 reproduces ols_fit on the full history. 
+    
+    >>> rls = RecursiveLeastSquares()
+    >>> for y_i, x_i in zip([2, 4, 5, 4, 5], [1, 2, 3, 4, 5]):
+    ...     rls.update(y_i, x_i)
+    >>> [round(b, 10) for b in rls.coefficients()]
+    [2.2, 0.6]
+    >>> round(rls.ssr(), 10)
+    2.4
+    >>> rls = RecursiveLeastSquares(forgetting=0.5)
+    >>> for y_i, x_i in zip([1, 2, 3, 10, 12, 14], [1, 2, 3, 4, 5, 6]):
+    ...     rls.update(y_i, x_i)
+    >>> round(rls.coefficients()[1], 4)
+    2.8829
+    >>> RecursiveLeastSquares().coefficients()
+    Traceback (most recent call last):
+    ...
+    ValueError: The coefficients are not defined until two different values of x have arrived.
+
+    """
+    
+    def __init__(self, forgetting=1.0):
+        self.forgetting = forgetting
+        self.moments = MomentAccumulator()
+    
+    def update(self, y, x):
+        """Add the observation (y, x) and discount the earlier ones."""
+        
+        acc = self.moments
+        if self.forgetting != 1.0:
+            acc.n = acc.n*self.forgetting
+            acc.m_xx = acc.m_xx*self.forgetting
+            acc.m_yy = acc.m_yy*self.forgetting
+            acc.c_xy = acc.c_xy*self.forgetting
+        acc.update(y, x)
+    
+    def _m_xx(self):
+        """
+        Return the sum of squared deviations of x, 
+        or raise ValueError if no two observed x values differ.
+        """
+        
+        if self.moments.m_xx <= 0:
+            raise ValueError('The coefficients are not defined until '
+                             + 'two different values of x have arrived.')
+        return self.moments.m_xx
+    
+    def coefficients(self):
+        """Return the current intercept and slope as (beta_0, beta_1)."""
+        
+        beta_1 = self.moments.c_xy/self._m_xx()
+        beta_0 = self.moments.y_bar - beta_1*self.moments.x_bar
+        return beta_0, beta_1
+    
+    def ssr(self):
+        """Return the (discounted) sum of squared residuals at the current fit."""
+        
+        acc = self.moments
+        return max(acc.m_yy - acc.c_xy**2/self._m_xx(), 0.0)
+
+
+##################################################
+# Part l) Binary Column Files
+##################################################
+
+# First bytes of a binary column file.
+_COLUMN_FILE_MAGIC = b'QMBCOL01'
+
+
+def write_columns(file_name, columns, dtype='<f8'):
+    """Writes a dictionary of equal-length numeric columns 
+    to a binary column file that read_columns can memory-map. 
+    
+    The file starts with the 8 bytes QMBCOL01, 
+    the length of the header as a 4-byte little-endian integer 
+    and a JSON header with the dtype, the length and 
+    the column names, padded to a multiple of 64 bytes. 
+    The columns follow one after another in the order of the names 
+    and are written one block at a time, so columns that already 
+    have the dtype and are contiguous are written without a copy.
+    Requires NumPy.
+    """
+    
+    if np is None:
+        raise ImportError('write_columns requires NumPy.')
+    
+    names = list(columns)
+    dtype = np.dtype(dtype)
+    length = len(columns[names[0]]) if names else 0
+    for name in names:
+        if len(columns[name]) != length:
+            raise ValueError('Column ' + name + ' has a different length.')
+    
+    header = json.dumps({'dtype': dtype.str, 'length': length, 
+                         'columns': names}).encode('utf-8')
+    offset = len(_COLUMN_FILE_MAGIC) + 4 + len(header)
+    header = header + b' '*(-offset % 64)
+    
+    with open(file_name, 'wb') as column_file:
+        column_file.write(_COLUMN_FILE_MAGIC)
+        column_file.write(len(header).to_bytes(4, 'little'))
+        column_file.write(header)
+        for name in names:
+            column = np.asarray(columns[name]).reshape(-1)
+            for start in range(0, length, _BLOCK_SIZE):
+                block = column[start:start + _BLOCK_SIZE].astype(dtype, 
+                                                                 copy=False)
+                column_file.write(np.ascontiguousarray(block))
+
+
+def read_columns(file_name, mode='r'):
+    """Opens a binary column file written by write_columns 
+    and returns a dictionary of np.memmap views, one per column,
+    keyed by column name. 
+    
+    The data are not read into memory: the views can be passed 
+    to variance, covariance, ols_slope, ssr and ols_fit, 
+    which reduce them one block at a time. 
+    Requires NumPy.
+    
+    >>> import os, tempfile
+    >>> file_name = os.path.join(tempfile.mkdtemp(), 'sales.qmb')
+    >>> write_columns(file_name, {'price': [102, 106, 88, 104, 100], 
+    ...                           'age': [101, 103, 94, 102, 100]})
+    >>> data = read_columns(file_name)
+    >>> list(data)
+    ['price', 'age']
+    >>> ols_slope(data['price'], data['age'])
+    2.0
+    >>> variance(data['age'])
+    12.5
+    >>> del data
+    >>> os.remove(file_name)
+
+    """
+    
+    if np is None:
+        raise ImportError('read_columns requires NumPy.')
+    
+    with open(file_name, 'rb') as column_file:
+        magic = column_file.read(len(_COLUMN_FILE_MAGIC))
+        if magic != _COLUMN_FILE_MAGIC:
+            raise ValueError(file_name + ' is not a binary column file.')
+        header_size = int.from_bytes(column_file.read(4), 'little')
+        header = json.loads(column_file.read(header_size).decode('utf-8'))
+    
+    names = header['columns']
+    length = header['length']
+    if len(names) == 0 or length == 0:
+        return {name: np.empty(0, dtype=header['dtype']) for name in names}
+    
+    offset = len(_COLUMN_FILE_MAGIC) + 4 + header_size
+    data = np.memmap(file_name, dtype=header['dtype'], mode=mode, 
+                     offset=offset, shape=(len(names), length))
+    return {name: data[i] for i, name in enumerate(names)}
+
+
 ##################################################
 # End
 ##################################################
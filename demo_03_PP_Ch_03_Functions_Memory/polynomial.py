@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+##################################################
+#
+# QMB 6315: Python for Business Analytics
+#
+##################################################
+#
+# Vectorized Polynomial Evaluation
+# for the quadratic function in PP_Ch_3A.py
+#
+##################################################
+"""
+
+
+##################################################
+# Import Modules.
+##################################################
+
+import numpy as np
+
+
+##################################################
+# Function Definitions
+##################################################
+
+
+def horner(coefficients, x, out=None):
+    """Return the polynomial with the given coefficients,
+    ordered from the highest power to the constant, evaluated at x
+    by Horner's scheme: (...((c_0*x + c_1)*x + c_2)...)*x + c_n.
+
+    x and each coefficient may be numbers or arrays;
+    they are broadcast against each other.
+    If out is given, the result is written into that array
+    and no intermediate arrays are allocated, unless out shares
+    memory with x or a coefficient, which is then copied first.
+
+    >>> horner([2, 3, 4], 0.5)
+    6.0
+    >>> horner([1, 0, 0, -1], np.array([0.0, 1.0, 2.0]))
+    array([-1.,  0.,  7.])
+    >>> buffer = np.empty(3)
+    >>> horner([2, 3, 4], np.array([0.0, 0.5, 1.5]), out=buffer)
+    array([ 4.,  6., 13.])
+    >>> buffer
+    array([ 4.,  6., 13.])
+    >>> x = np.array([0.0, 0.5, 1.5])
+    >>> horner([2, 3, 4], x, out=x)
+    array([ 4.,  6., 13.])
+    """
+
+    if out is None and all(np.ndim(c) == 0 for c in coefficients) \
+            and np.ndim(x) == 0:
+        value = coefficients[0]
+        for c in coefficients[1:]:
+            value = value*x + c
+        return value
+
+    if out is None:
+        shape = np.broadcast_shapes(np.shape(x),
+                                    *[np.shape(c) for c in coefficients])
+        out = np.empty(shape, dtype=np.float64)
+    else:
+        # x and the coefficients are read again after out is first
+        # written, so copy any that share memory with out.
+        if np.may_share_memory(out, x):
+            x = np.copy(x)
+        coefficients = [np.copy(c) if np.may_share_memory(out, c) else c
+                        for c in coefficients]
+
+    out[...] = coefficients[0]
+    for c in coefficients[1:]:
+        np.multiply(out, x, out=out)
+        np.add(out, c, out=out)
+    return out
+
+
+def quadratic(a, b, c, x, out=None):
+    """Return the value of the quadratic a*x**2 + b*x + c,
+    evaluated by Horner's scheme as (a*x + b)*x + c.
+
+    a, b, c and x may be numbers or arrays that broadcast together,
+    so one call scores many points or many coefficient triples.
+    If out is given, the result is written into that array.
+
+    >>> quadratic(2, 3, 4, 0.5)
+    6.0
+    >>> quadratic(2, 3, 4, 1)
+    9
+    >>> quadratic(1, 0, 0, float('inf'))
+    inf
+    >>> quadratic(2, 3, 4, np.array([0.5, 1.5]))
+    array([ 6., 13.])
+    >>> quadratic(np.array([1, 2]), 3, 4, 0.5)
+    array([5.75, 6.  ])
+    """
+
+    return horner([a, b, c], x, out)
+
+
+def quadratic_grid(a, b, c, x, out=None):
+    """Return the quadratics with coefficient triples (a[i], b[i], c[i])
+    evaluated at every point x[j], as an array of shape (len(a), len(x)).
+
+    If out is given, it must have that shape
+    and the result is written into it.
+
+    >>> quadratic_grid([1, 2], [0, 3], [0, 4], [0.0, 0.5, 1.0])
+    array([[0.  , 0.25, 1.  ],
+           [4.  , 6.  , 9.  ]])
+    """
+
+    a = np.asarray(a, dtype=np.float64).reshape(-1, 1)
+    b = np.asarray(b, dtype=np.float64).reshape(-1, 1)
+    c = np.asarray(c, dtype=np.float64).reshape(-1, 1)
+    x = np.asarray(x, dtype=np.float64).reshape(1, -1)
+    return horner([a, b, c], x, out)
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
+
+
+##################################################
+# End
+##################################################
@@ -20,6 +20,7 @@ def get_preheating_instructions(fahrenheit: float) -> str:
     return 'Preheat oven to ' + fahr + ' degrees F ('+ cels +' degrees C).'
 
 
-fahr = float(input('Enter the baking temperature in degrees Fahrenheit: '))
-print(get_preheating_instructions(fahr))
+if __name__ == '__main__':
+    fahr = float(input('Enter the baking temperature in degrees Fahrenheit: '))
+    print(get_preheating_instructions(fahr))
 
@@ -5,19 +5,51 @@ Created on Mon Feb 15 10:39:16 2021
 @author: le279259
 """
 
+from functools import lru_cache
+
 import temperature_program
 
+PREHEATING_TEMPLATE = 'Preheat oven to {} degrees F ({} degrees C).'
+
+
+@lru_cache(maxsize=4096, typed=True)
 def get_preheating_instructions(fahrenheit: float) -> str:
     """Return instructions for preheating the oven in fahreneheit degrees and
     Celsius degrees.
 
-    get_preheating_instructions(500)
+    Results are cached by temperature, so repeated temperatures are
+    rendered only once; 500 and 500.0 are cached separately.
+
+    >>> get_preheating_instructions(500)
     'Preheat oven to 500 degrees F (260.0 degrees C).'
     """
 
-    cels = str(temperature_program.convert_to_celsius(fahrenheit))
-    fahr = str(fahrenheit)
-    return 'Preheat oven to ' + fahr + ' degrees F ('+ cels +' degrees C).'
+    cels = temperature_program.convert_to_celsius(fahrenheit)
+    return PREHEATING_TEMPLATE.format(fahrenheit, cels)
+
+
+def get_preheating_instructions_batch(temperatures) -> list:
+    """Return the preheating instructions for each temperature in
+    temperatures, which may be a list or a NumPy array.
+
+    >>> get_preheating_instructions_batch([350, 425.0, 350])
+    ['Preheat oven to 350 degrees F (176.66666666666666 degrees C).', \
+'Preheat oven to 425.0 degrees F (218.33333333333334 degrees C).', \
+'Preheat oven to 350 degrees F (176.66666666666666 degrees C).']
+    """
+
+    if hasattr(temperatures, 'tolist'):
+        temperatures = temperatures.tolist()
+    render = get_preheating_instructions
+    return [render(fahrenheit) for fahrenheit in temperatures]
+
+
+def preheating_cache_info():
+    """Return the hits, misses, maximum size and current size of the
+    cache of rendered preheating instructions.
+    """
+
+    return get_preheating_instructions.cache_info()
 
 
 if __name__ == '__main__':
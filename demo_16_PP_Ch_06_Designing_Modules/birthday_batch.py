@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+"""
+##################################################
+#
+# QMB 6315: Python for Business Analytics
+#
+##################################################
+#
+# Array versions of the functions in birthday_v3.py
+# for whole columns of days and weekdays
+#
+##################################################
+"""
+
+
+##################################################
+# Import Modules.
+##################################################
+
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+##################################################
+# Function Definitions
+##################################################
+
+
+def get_weekday_array(current_weekday, days_ahead) -> np.ndarray:
+    """Return which day of the week it will be days_ahead days from
+    current_weekday, for arrays, lists or pandas columns of integers.
+
+    current_weekday is the current day of the week and is in the range 1-7,
+    indicating whether today is Sunday (1), Monday (2), ..., Saturday (7).
+
+    days_ahead is the number of days after today.
+
+    >>> get_weekday_array([3, 6, 7, 1, 4, 7], [1, 1, 1, 0, 7, 72])
+    array([4, 7, 1, 1, 4, 2])
+    >>> get_weekday_array(7, np.array([-1, -7, -8]))
+    array([6, 7, 6])
+    """
+
+    current_weekday = np.asarray(current_weekday)
+    days_ahead = np.asarray(days_ahead)
+    return (current_weekday + days_ahead - 1) % 7 + 1
+
+
+def days_difference_array(day1, day2) -> np.ndarray:
+    """Return the number of days between day1 and day2, which are both
+    arrays, lists or pandas columns of days of the year in the range 1-365.
+
+    The days are converted to int64 before subtracting, so unsigned
+    columns, such as days stored as uint16, give negative differences
+    instead of wrapping around.
+
+    >>> days_difference_array([200, 50, 100], [224, 50, 99])
+    array([24,  0, -1])
+    >>> days_difference_array(np.uint16([116]), np.uint16([3]))
+    array([-113])
+    """
+
+    return np.asarray(day2, dtype=np.int64) - np.asarray(day1, dtype=np.int64)
+
+
+def get_birthday_weekday_array(current_weekday, current_day,
+                               birthday_day) -> np.ndarray:
+    """Return the day of the week it will be on birthday_day, given that
+    the day of the week is current_weekday and the day of the year is
+    current_day, element by element for arrays, lists or pandas columns.
+
+    current_weekday is the current day of the week and is in the range 1-7,
+    indicating whether today is Sunday (1), Monday (2), ..., Saturday (7).
+
+    current_day and birthday_day are both in the range 1-365.
+
+    >>> get_birthday_weekday_array([5, 5, 6], [3, 3, 116], [4, 116, 3])
+    array([6, 6, 5])
+    >>> get_birthday_weekday_array(np.uint8([6]), np.uint16([116]),
+    ...                            np.uint16([3]))
+    array([5])
+    """
+
+    current_weekday = np.asarray(current_weekday)
+    days_diff = days_difference_array(current_day, birthday_day)
+    return (current_weekday + days_diff - 1) % 7 + 1
+
+
+##################################################
+# Lookup Table
+##################################################
+
+# Number of days in the year used by the birthday functions.
+DAYS_IN_YEAR = 365
+
+# Number of possible values of birthday_day - current_day,
+# from -(DAYS_IN_YEAR - 1) to DAYS_IN_YEAR - 1.
+DAY_DIFFERENCES = 2*DAYS_IN_YEAR - 1
+
+# Table of get_birthday_weekday by weekday and difference in days,
+# built on first use by weekday_table() or attached from shared memory.
+_weekday_table = None
+
+
+def weekday_table() -> np.ndarray:
+    """Return the table of get_birthday_weekday for every weekday w
+    in 1-7 and every difference d = birthday_day - current_day
+    in -364 to 364, stored as uint8 at position [w - 1, d + 364]
+    (5,103 bytes). The table is built on the first call.
+
+    The weekday depends on the two days only through their difference,
+    so this table covers all 7 x 365 x 365 valid inputs.
+
+    >>> weekday_table().shape, weekday_table().nbytes
+    ((7, 729), 5103)
+    """
+
+    global _weekday_table
+    if _weekday_table is None:
+        weekday, days_diff = np.ogrid[1:8, -(DAYS_IN_YEAR - 1):DAYS_IN_YEAR]
+        _weekday_table = get_weekday_array(weekday,
+                                           days_diff).astype(np.uint8)
+    return _weekday_table
+
+
+def get_birthday_weekday_lookup(current_weekday, current_day,
+                                birthday_day) -> np.ndarray:
+    """Return the same result as get_birthday_weekday_array by looking
+    it up in weekday_table(), for arrays, lists or pandas columns.
+
+    Raises ValueError unless every current_weekday is in the range 1-7
+    and every birthday_day - current_day is in the range -364 to 364,
+    which holds whenever both days are in the range 1-365.
+
+    For single integers, use get_birthday_weekday in birthday_v3.py:
+    in CPython the cost of a scalar call is dominated by the call
+    itself, and a table lookup measured no faster than the arithmetic
+    (see birthday_benchmark.py).
+
+    >>> get_birthday_weekday_lookup([5, 5, 6], [3, 3, 116], [4, 116, 3])
+    array([6, 6, 5], dtype=uint8)
+    >>> get_birthday_weekday_lookup(np.int8([6]), np.uint16([116]),
+    ...                             np.uint16([3]))
+    array([5], dtype=uint8)
+    >>> get_birthday_weekday_lookup([1], [0], [400])
+    Traceback (most recent call last):
+    ...
+    ValueError: birthday_day - current_day must be in the range -364 to 364.
+    """
+
+    table = weekday_table()
+    current_weekday = np.asarray(current_weekday).astype(np.intp, copy=False)
+    days_diff = days_difference_array(current_day,
+                                      birthday_day).astype(np.intp, copy=False)
+
+    if current_weekday.size > 0 and (current_weekday.min() < 1
+                                     or current_weekday.max() > 7):
+        raise ValueError('current_weekday must be in the range 1-7.')
+    if days_diff.size > 0 and (days_diff.min() < -(DAYS_IN_YEAR - 1)
+                               or days_diff.max() > DAYS_IN_YEAR - 1):
+        raise ValueError('birthday_day - current_day must be in the range '
+                         + str(-(DAYS_IN_YEAR - 1)) + ' to '
+                         + str(DAYS_IN_YEAR - 1) + '.')
+
+    index = current_weekday*DAY_DIFFERENCES
+    index = index + days_diff
+    index -= DAY_DIFFERENCES - (DAYS_IN_YEAR - 1)
+    return table.reshape(-1)[index]
+
+
+def share_weekday_table() -> shared_memory.SharedMemory:
+    """Copy weekday_table() into a new block of shared memory and
+    return the block, whose name can be passed to attach_weekday_table
+    in other processes. The caller must call close() and unlink()
+    on the block when the workers are finished.
+    """
+
+    table = weekday_table()
+    shm = shared_memory.SharedMemory(create=True, size=table.nbytes)
+    shared = np.ndarray(table.shape, dtype=np.uint8, buffer=shm.buf)
+    shared[...] = table
+    del shared
+    return shm
+
+
+def attach_weekday_table(name: str) -> shared_memory.SharedMemory:
+    """Use the lookup table in the shared memory block called name,
+    created by share_weekday_table, instead of building a copy in this
+    process. Return the block, which must stay open while it is used.
+    """
+
+    global _weekday_table
+    shm = shared_memory.SharedMemory(name=name)
+    _weekday_table = np.ndarray((7, DAY_DIFFERENCES), dtype=np.uint8,
+                                buffer=shm.buf)
+    return shm
+
+
+##################################################
+# Calendar Dates
+##################################################
+
+
+def _birthday_in_year(year: np.ndarray, month: np.ndarray,
+                      day: np.ndarray) -> np.ndarray:
+    """Return the dates with the given 0-based month and day in each
+    datetime64[Y] year, moving days past the end of the month, such as
+    February 29 in a common year, back to the last day of the month.
+    """
+
+    month_start = year.astype('datetime64[M]') + month
+    month_length = ((month_start + 1).astype('datetime64[D]')
+                    - month_start.astype('datetime64[D]')).astype(np.int64)
+    return month_start.astype('datetime64[D]') + np.minimum(day,
+                                                            month_length - 1)
+
+
+def next_birthday(today, birth_date):
+    """Return the day of the week of the next birthday on or after today
+    for someone born on birth_date, and the number of days until then,
+    as a pair of arrays.
+
+    today and birth_date are datetime64 arrays, date strings or pandas
+    date columns. The day of the week is in the range 1-7, indicating
+    Sunday (1), Monday (2), ..., Saturday (7). Leap years are taken into
+    account; a birthday on February 29 falls on February 28 in common years.
+
+    Raises ValueError if any date is missing (NaT), because neither result
+    is defined for it; drop or fill missing dates before calling.
+
+    >>> today = np.array(['2025-02-28', '2025-03-01', '2024-02-28'],
+    ...                  dtype='datetime64[D]')
+    >>> birth_date = np.array(['2000-02-29', '2000-02-29', '2000-02-29'],
+    ...                       dtype='datetime64[D]')
+    >>> next_birthday(today, birth_date)
+    (array([6, 7, 5]), array([  0, 364,   1]))
+    >>> next_birthday(np.datetime64('2026-10-18'), np.datetime64('1990-12-25'))
+    (np.int64(6), np.int64(68))
+    >>> next_birthday(today, np.array(['2000-02-29', 'NaT', '2000-02-29'],
+    ...                               dtype='datetime64[D]'))
+    Traceback (most recent call last):
+    ...
+    ValueError: today and birth_date must not contain missing dates (NaT).
+    """
+
+    today = np.asarray(today, dtype='datetime64[D]')
+    birth_date = np.asarray(birth_date, dtype='datetime64[D]')
+    if np.isnat(today).any() or np.isnat(birth_date).any():
+        raise ValueError('today and birth_date must not contain '
+                         + 'missing dates (NaT).')
+
+    birth_month_start = birth_date.astype('datetime64[M]')
+    month = (birth_month_start
+             - birth_date.astype('datetime64[Y]')).astype(np.int64)
+    day = (birth_date
+           - birth_month_start.astype('datetime64[D]')).astype(np.int64)
+
+    year = today.astype('datetime64[Y]')
+    birthday = _birthday_in_year(year, month, day)
+    birthday = np.where(birthday < today,
+                        _birthday_in_year(year + 1, month, day), birthday)
+
+    days_until = (birthday - today).astype(np.int64)
+    # Day 0 of datetime64, 1970-01-01, was a Thursday (5).
+    weekday = (birthday.astype(np.int64) + 4) % 7 + 1
+    return weekday, days_until
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+##################################################
+#
+# QMB 6315: Python for Business Analytics
+#
+##################################################
+#
+# Micro-benchmark of get_birthday_weekday in birthday_v3.py
+# against the lookup table in birthday_batch.py
+#
+##################################################
+"""
+
+
+##################################################
+# Import Modules.
+##################################################
+
+import timeit
+
+import numpy as np
+
+import birthday_v3
+import birthday_batch
+
+
+##################################################
+# Function Definitions
+##################################################
+
+
+def time_per_call(function, arguments, repeat: int = 5) -> float:
+    """Return the best time in nanoseconds per call of function
+    over the list of argument tuples arguments.
+    """
+
+    def run():
+        for args in arguments:
+            function(*args)
+
+    best = min(timeit.repeat(run, number=1, repeat=repeat))
+    return best/len(arguments)*1e9
+
+
+def main(n: int = 200000) -> None:
+    """Time n random calls of get_birthday_weekday against a plain
+    Python lookup in the same table with a range check, then the array formula against
+    the array lookup over columns of n elements, and print the speedups.
+    """
+
+    rng = np.random.default_rng(0)
+    columns = [rng.integers(1, 8, n), rng.integers(1, 366, n),
+               rng.integers(1, 366, n)]
+    arguments = list(zip(*[column.tolist() for column in columns]))
+    table = birthday_batch.weekday_table().tobytes()
+    width = birthday_batch.DAY_DIFFERENCES
+    offset = width - (birthday_batch.DAYS_IN_YEAR - 1)
+
+    def scalar_lookup(current_weekday, current_day, birthday_day):
+        index = current_weekday*width + birthday_day - current_day - offset
+        if 0 <= index < len(table):
+            return table[index]
+        raise ValueError('Day or weekday out of range.')
+
+    chain = time_per_call(birthday_v3.get_birthday_weekday, arguments)
+    lookup = time_per_call(scalar_lookup, arguments)
+    print('Function chain:  {:8.1f} ns per call'.format(chain))
+    print('Scalar lookup:   {:8.1f} ns per call ({:.1f}x)'.format(
+        lookup, chain/lookup))
+
+    chain_array = min(timeit.repeat(
+        lambda: birthday_batch.get_birthday_weekday_array(*columns),
+        number=1, repeat=5))/n*1e9
+    lookup_array = min(timeit.repeat(
+        lambda: birthday_batch.get_birthday_weekday_lookup(*columns),
+        number=1, repeat=5))/n*1e9
+    print('Array formula:   {:8.1f} ns per element'.format(chain_array))
+    print('Array lookup:    {:8.1f} ns per element ({:.1f}x)'.format(
+        lookup_array, chain_array/lookup_array))
+
+if __name__ == "__main__":
+    main()
@@ -94,8 +94,6 @@ def get_birthday_weekday(current_weekday: int, current_day: int,
 
 if __name__ == "__main__":
     print("Running main program for module birthday_v3.")
-else:
-    print("importing module birthday_v3.")
 
 
 
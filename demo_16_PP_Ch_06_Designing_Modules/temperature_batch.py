@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+##################################################
+#
+# QMB 6315: Python for Business Analytics
+#
+##################################################
+#
+# Batch versions of convert_to_celsius and above_freezing
+# from temperature.py for whole buffers of readings
+#
+##################################################
+"""
+
+
+##################################################
+# Import Modules.
+##################################################
+
+from functools import lru_cache
+
+import numpy as np
+
+
+##################################################
+# Function Definitions
+##################################################
+
+
+def as_float_buffer(readings) -> np.ndarray:
+    """Return a float ndarray that shares memory with readings,
+    which may be an ndarray, an array.array('d') or array.array('f')
+    or a writable memoryview of one, so that it can be modified in place.
+
+    >>> from array import array
+    >>> readings = array('d', [32.0, 212.0])
+    >>> as_float_buffer(readings)[0] = 50.0
+    >>> readings
+    array('d', [50.0, 212.0])
+    >>> as_float_buffer(memoryview(readings)[::2])[0] = 68.0
+    >>> readings
+    array('d', [68.0, 212.0])
+    """
+
+    if isinstance(readings, np.ndarray):
+        buffer = readings
+    else:
+        # np.asarray follows the strides of the view, which
+        # np.frombuffer rejects for sliced memoryviews.
+        buffer = np.asarray(memoryview(readings))
+    if buffer.dtype.kind != 'f':
+        raise TypeError('Readings must be stored as floats '
+                        + 'to be converted in place.')
+    return buffer
+
+
+def convert_to_celsius_inplace(readings) -> np.ndarray:
+    """Convert the Fahrenheit readings in a float buffer to Celsius
+    in place, with the same arithmetic as convert_to_celsius,
+    and return the buffer as an ndarray.
+
+    >>> readings = np.array([75.0, 32.0, 212.0])
+    >>> convert_to_celsius_inplace(readings)
+    array([ 23.88888889,   0.        , 100.        ])
+    >>> readings[0]
+    np.float64(23.88888888888889)
+    """
+
+    buffer = as_float_buffer(readings)
+    np.subtract(buffer, 32.0, out=buffer)
+    np.multiply(buffer, 5.0, out=buffer)
+    np.divide(buffer, 9.0, out=buffer)
+    return buffer
+
+
+def convert_to_celsius_array(fahrenheit) -> np.ndarray:
+    """Return a new array of the Celsius degrees equivalent to
+    each reading in fahrenheit.
+
+    >>> convert_to_celsius_array([75, 32])
+    array([23.88888889,  0.        ])
+    """
+
+    return convert_to_celsius_inplace(np.array(fahrenheit, dtype=np.float64))
+
+
+@lru_cache(maxsize=8)
+def celsius_table(low: int, high: int, scale: int = 1) -> np.ndarray:
+    """Return the Celsius equivalents of every Fahrenheit reading
+    from low to high degrees in steps of 1/scale degrees,
+    computed once per (low, high, scale) and cached.
+
+    >>> celsius_table(32, 34, 2)
+    array([0.        , 0.27777778, 0.55555556, 0.83333333, 1.11111111])
+    """
+
+    steps = np.arange(low*scale, high*scale + 1, dtype=np.float64)
+    table = convert_to_celsius_inplace(steps/scale)
+    table.flags.writeable = False
+    return table
+
+
+def convert_to_celsius_lookup(readings, low: int = -460, high: int = 1000,
+                              scale: int = 1) -> np.ndarray:
+    """Return the Celsius equivalents of integer or fixed-precision
+    readings, given as integers in units of 1/scale degrees Fahrenheit
+    between low and high degrees, by indexing a precomputed table
+    instead of doing the arithmetic for every reading.
+    Readings of any integer dtype, signed or unsigned, are accepted.
+
+    >>> convert_to_celsius_lookup(np.array([32, 212, -40]))
+    array([  0., 100., -40.])
+    >>> convert_to_celsius_lookup(np.array([750, 320]), scale=10)
+    array([23.88888889,  0.        ])
+    >>> convert_to_celsius_lookup(np.array([32, 212], dtype=np.uint16))
+    array([  0., 100.])
+    """
+
+    table = celsius_table(low, high, scale)
+    index = np.asarray(readings).astype(np.intp, casting='same_kind',
+                                        copy=False) - low*scale
+    if index.size > 0 and (index.min() < 0 or index.max() >= len(table)):
+        raise ValueError('Readings must be between ' + str(low)
+                         + ' and ' + str(high) + ' degrees Fahrenheit.')
+    return table[index]
+
+
+def above_freezing_mask(celsius) -> np.ndarray:
+    """Return a packed bitmask with one bit per reading in celsius,
+    set iff the temperature is above freezing,
+    eight readings per byte in the order of np.packbits.
+    Use np.unpackbits(mask, count=len(celsius)) to recover the flags.
+
+    >>> mask = above_freezing_mask(np.array([5.2, -2, 0, 1, 3, 4, 5, 6, 7]))
+    >>> mask
+    array([159, 128], dtype=uint8)
+    >>> np.unpackbits(mask, count=9).astype(bool)
+    array([ True, False, False,  True,  True,  True,  True,  True,  True])
+    """
+
+    return np.packbits(np.asarray(celsius) > 0)
+
+
+if __name__ == "__main__":
+    import doctest
+    doctest.testmod()
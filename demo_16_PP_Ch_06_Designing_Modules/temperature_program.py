@@ -5,6 +5,9 @@ Created on Mon Feb 15 10:34:46 2021
 @author: le279259
 """
 
+import sys
+
+
 def convert_to_celsius(fahrenheit: float) -> float:
     """Return the number of Celsius degrees equivalent to fahrenheit
     degrees.
@@ -26,9 +29,75 @@ def above_freezing(celsius: float) -> bool:
     return celsius > 0
 
 
-fahrenheit = float(input('Enter the temperature in degrees Fahrenheit: '))
-celsius = convert_to_celsius(fahrenheit)
-if above_freezing(celsius):
-    print('It is above freezing.')
-else:
-    print('It is below freezing.')
+def convert_lines(lines) -> str:
+    """Return the output for a chunk of lines of Fahrenheit readings:
+    one line per reading with the Celsius degrees and whether it is
+    above freezing, separated by a comma. Blank lines are skipped.
+
+    >>> print(convert_lines(['75\\n', '\\n', '14\\n']), end='')
+    23.88888888888889,True
+    -10.0,False
+    """
+    output = []
+    for line in lines:
+        if line.strip():
+            celsius = convert_to_celsius(float(line))
+            output.append(str(celsius) + ',' + str(above_freezing(celsius))
+                          + '\n')
+    return ''.join(output)
+
+
+def convert_stream(in_file, out_file, chunk_size: int = 65536) -> None:
+    """Read newline-delimited Fahrenheit readings from in_file and write
+    the converted and classified readings to out_file, reading about
+    chunk_size characters of whole lines at a time and making one write
+    per chunk.
+
+    >>> import io
+    >>> out_file = io.StringIO()
+    >>> convert_stream(io.StringIO('32\\n212\\n'), out_file, chunk_size=1)
+    >>> print(out_file.getvalue(), end='')
+    0.0,False
+    100.0,True
+    """
+    while True:
+        lines = in_file.readlines(chunk_size)
+        if not lines:
+            break
+        out_file.write(convert_lines(lines))
+
+
+def main(argv=None) -> None:
+    """Run the program.
+
+    With no arguments, ask for one temperature and say whether it is
+    above freezing. With --batch, convert every reading in the files
+    named after it, or in standard input if there are none or the name
+    is -, and write the results to standard output.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if not argv:
+        fahrenheit = float(input('Enter the temperature in degrees Fahrenheit: '))
+        celsius = convert_to_celsius(fahrenheit)
+        if above_freezing(celsius):
+            print('It is above freezing.')
+        else:
+            print('It is below freezing.')
+        return
+
+    if argv[0] != '--batch':
+        sys.exit('usage: temperature_program.py [--batch [FILE ...]]')
+
+    file_names = argv[1:] or ['-']
+    for file_name in file_names:
+        if file_name == '-':
+            convert_stream(sys.stdin, sys.stdout)
+        else:
+            with open(file_name) as in_file:
+                convert_stream(in_file, sys.stdout)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+"""
+Tests that the modules in this folder can be imported
+without side effects and within a bounded cold-start time.
+"""
+
+import os
+import subprocess
+import sys
+import unittest
+
+# Folder containing the modules under test.
+MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Upper bound on the cumulative import time of each module, in microseconds.
+MAX_IMPORT_MICROSECONDS = 50000
+
+
+def import_in_fresh_interpreter(module_name: str):
+    """Import module_name in a new interpreter with no standard input
+    and return its standard output and its cumulative import time
+    in microseconds, as reported by python -X importtime.
+    """
+
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import ' + module_name],
+        cwd=MODULE_DIR, stdin=subprocess.DEVNULL, capture_output=True,
+        text=True, timeout=60)
+    if result.returncode != 0:
+        raise AssertionError('Importing ' + module_name + ' failed:\n'
+                             + result.stderr)
+
+    for line in result.stderr.splitlines():
+        fields = line.split('|')
+        if len(fields) == 3 and fields[2].strip() == module_name:
+            return result.stdout, int(fields[1])
+    raise AssertionError('No import time reported for ' + module_name)
+
+
+class TestImportTime(unittest.TestCase):
+    """Tests for importing the baking, temperature and birthday modules."""
+
+    def check_module(self, module_name: str):
+        """Check that module_name imports silently and quickly."""
+
+        output, microseconds = import_in_fresh_interpreter(module_name)
+        self.assertEqual('', output,
+            "Importing " + module_name + " prints nothing.")
+        self.assertLess(microseconds, MAX_IMPORT_MICROSECONDS,
+            "Importing " + module_name + " is fast.")
+
+    def test_import_baking(self):
+        """Test baking, which imports temperature_program."""
+
+        self.check_module('baking')
+
+    def test_import_better_baking(self):
+        """Test better_baking."""
+
+        self.check_module('better_baking')
+
+    def test_import_temperature_program(self):
+        """Test temperature_program."""
+
+        self.check_module('temperature_program')
+
+    def test_import_birthday_v1(self):
+        """Test birthday_v1."""
+
+        self.check_module('birthday_v1')
+
+    def test_import_birthday_v2(self):
+        """Test birthday_v2."""
+
+        self.check_module('birthday_v2')
+
+    def test_import_birthday_v3(self):
+        """Test birthday_v3."""
+
+        self.check_module('birthday_v3')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,16 +5,178 @@ Created on Tue Apr 13 15:58:01 2021
 @author: le279259
 """
 
-from typing import List
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import MutableSequence
 
-def running_sum(L: List[float]) -> None:
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _as_writable_vector(L):
+    """Return a one-dimensional ndarray sharing memory with L if L is an
+    ndarray, an array.array or a writable memoryview, or None otherwise.
+    """
+    if np is None or isinstance(L, list):
+        return None
+    if isinstance(L, np.ndarray):
+        vector = L
+    else:
+        try:
+            view = memoryview(L)
+        except TypeError:
+            return None
+        if view.readonly or view.ndim != 1:
+            return None
+        # np.asarray follows the strides of the view, which
+        # np.frombuffer rejects for sliced memoryviews.
+        vector = np.asarray(view)
+    if vector.ndim != 1 or not vector.flags.writeable:
+        return None
+    return vector
+
+
+def running_sum(L: MutableSequence[float]) -> None:
     """Modify L so that it contains the running sums of its original items.
 
+    Arrays, typed arrays and writable memoryviews are summed in place
+    with NumPy's cumulative sum; integer arrays keep their dtype and
+    wrap around on overflow, unlike Python integers.
+
     >>> L = [4, 0, 2, -5, 0]
     >>> running_sum(L)
     >>> L
     [4, 4, 6, 1, 1]
+    >>> A = np.array([4, 0, 2, -5, 0])
+    >>> running_sum(A)
+    >>> A
+    array([4, 4, 6, 1, 1])
     """
 
+    vector = _as_writable_vector(L)
+    if vector is not None:
+        np.cumsum(vector, out=vector)
+        return
+
     for i in range(1, len(L)):
         L[i] = L[i - 1] + L[i]
+
+
+def _attach_block(name: str, n: int, dtype: str, start: int, stop: int):
+    """Attach to the shared array called name and return the block
+    and the shared memory, which the caller must close after deleting
+    the block.
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    data = np.ndarray((n,), dtype=dtype, buffer=shm.buf)
+    return data[start:stop], shm
+
+
+def _scan_block(name: str, n: int, dtype: str, start: int, stop: int):
+    """Replace a block of the shared array with its running sums and
+    return the block total.
+    """
+    block, shm = _attach_block(name, n, dtype, start, stop)
+    try:
+        np.cumsum(block, out=block)
+        total = block[-1].item()
+        del block
+    finally:
+        shm.close()
+    return total
+
+
+def _offset_block(name: str, n: int, dtype: str, start: int, stop: int,
+                  offset) -> None:
+    """Add offset to every item in a block of the shared array."""
+    block, shm = _attach_block(name, n, dtype, start, stop)
+    try:
+        np.add(block, offset, out=block, casting='unsafe')
+        del block
+    finally:
+        shm.close()
+
+
+def _fits_int64(source) -> bool:
+    """Return True iff every running sum of the integer array source
+    is certain to fit in an int64, judging by the sum of the absolute
+    values in float64 with a margin for its rounding error.
+    """
+    return float(np.abs(source, dtype=np.float64).sum()) < 2.0**62
+
+
+def parallel_running_sum(L: MutableSequence[float], n_jobs: int = 4) -> None:
+    """Modify L so that it contains the running sums of its original items,
+    computed by n_jobs worker processes with a two-phase block scan.
+
+    The items are copied once into shared memory and split into n_jobs
+    contiguous blocks. Each worker replaces its block with the block's
+    running sums. The parent then computes running sums of the block
+    totals, and each worker adds the total of the preceding blocks to
+    its own block. The results are copied back into L.
+
+    Integer results are identical to running_sum. Lists of integers
+    whose running sums might not fit in an int64 are summed exactly
+    by running_sum in this process instead; arrays wrap around within
+    their integer dtype, as in running_sum. Float results are deterministic
+    for a given n_jobs, but they are summed in a different order than
+    running_sum: each item is the sum of the preceding block totals plus
+    a running sum within its block. So they can differ from running_sum,
+    and between different values of n_jobs, in the last bits.
+
+    >>> L = [4, 0, 2, -5, 0]
+    >>> parallel_running_sum(L, n_jobs=2)
+    >>> L
+    [4, 4, 6, 1, 1]
+    >>> L = [2**62, 2**62, 1]
+    >>> parallel_running_sum(L, n_jobs=2)
+    >>> L
+    [4611686018427387904, 9223372036854775808, 9223372036854775809]
+    """
+    if np is None:
+        raise ImportError('parallel_running_sum requires NumPy.')
+
+    vector = _as_writable_vector(L)
+    source = vector if vector is not None else np.asarray(L)
+    if vector is None and (source.dtype == object
+                           or (source.dtype.kind in 'iu'
+                               and not _fits_int64(source))):
+        running_sum(L)
+        return
+    if source.dtype.kind not in 'iuf':
+        raise TypeError('parallel_running_sum needs integers or floats '
+                        + 'that fit in a NumPy array.')
+    n = len(source)
+    if n == 0:
+        return
+    dtype = source.dtype.str
+
+    shm = shared_memory.SharedMemory(create=True, size=source.nbytes)
+    try:
+        data = np.ndarray((n,), dtype=dtype, buffer=shm.buf)
+        data[:] = source
+
+        bounds = [n*j//n_jobs for j in range(n_jobs + 1)]
+        blocks = [(bounds[j], bounds[j + 1]) for j in range(n_jobs)
+                  if bounds[j] < bounds[j + 1]]
+        with ProcessPoolExecutor(max_workers=len(blocks)) as pool:
+            totals = list(pool.map(_scan_block,
+                                   *zip(*[(shm.name, n, dtype, start, stop)
+                                          for start, stop in blocks])))
+            offsets = np.cumsum(np.array(totals[:-1], dtype=dtype))
+            futures = [pool.submit(_offset_block, shm.name, n, dtype,
+                                   start, stop, offsets[j - 1])
+                       for j, (start, stop) in enumerate(blocks) if j > 0]
+            for future in futures:
+                future.result()
+
+        if vector is not None:
+            vector[:] = data
+        else:
+            L[:] = data.tolist()
+        del data
+    finally:
+        shm.close()
+        shm.unlink()
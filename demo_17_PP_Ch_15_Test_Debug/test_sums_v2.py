@@ -7,6 +7,8 @@ Created on Tue Apr 13 15:58:32 2021
 
 
 import unittest
+from array import array
+import numpy as np
 import sums_v2 as sums
 
 class TestRunningSum(unittest.TestCase):
@@ -73,4 +75,82 @@ class TestRunningSum(unittest.TestCase):
             "The list contains a mixture of negative values, zeros and"
                          + "positive values.")
 
+    def test_running_sum_typed_array(self):
+        """Test a typed array of floats."""
+
+        argument = array('d', [4, 0, 2, -5, 0])
+        expected = array('d', [4, 4, 6, 1, 1])
+        sums.running_sum(argument)
+        self.assertEqual(expected, argument,
+            "The typed array is summed in place.")
+
+    def test_running_sum_memoryview(self):
+        """Test a memoryview of a typed array."""
+
+        data = array('d', [2, 5])
+        sums.running_sum(memoryview(data))
+        self.assertEqual(array('d', [2, 7]), data,
+            "The memoryview writes through to the array.")
+
+    def test_running_sum_ndarray(self):
+        """Test a NumPy array of integers."""
+
+        argument = np.array([4, 0, 2, -5, 0])
+        expected = [4, 4, 6, 1, 1]
+        sums.running_sum(argument)
+        self.assertEqual(expected, argument.tolist(),
+            "The array is summed in place.")
+
+    def test_running_sum_ndarray_slice(self):
+        """Test a strided view of a NumPy array of floats."""
+
+        data = np.array([1.0, 10.0, 2.0, 10.0, 3.0])
+        sums.running_sum(data[::2])
+        self.assertEqual([1.0, 10.0, 3.0, 10.0, 6.0], data.tolist(),
+            "The view writes through to the array.")
+
+    def test_running_sum_memoryview_slice(self):
+        """Test a strided memoryview of a typed array of floats."""
+
+        data = array('d', [1.0, 10.0, 2.0, 10.0, 3.0])
+        sums.running_sum(memoryview(data)[::2])
+        self.assertEqual(array('d', [1.0, 10.0, 3.0, 10.0, 6.0]), data,
+            "The view writes through to the typed array.")
+
+    def test_parallel_running_sum_list(self):
+        """Test the parallel running sum of a list of integers."""
+
+        argument = [4, 0, 2, -5, 0, 7, 3]
+        expected = [4, 4, 6, 1, 1, 8, 11]
+        sums.parallel_running_sum(argument, n_jobs=3)
+        self.assertEqual(expected, argument,
+            "The parallel running sum matches the serial one.")
+
+    def test_parallel_running_sum_more_jobs_than_items(self):
+        """Test more worker processes than items."""
+
+        argument = [2, 5]
+        expected = [2, 7]
+        sums.parallel_running_sum(argument, n_jobs=4)
+        self.assertEqual(expected, argument,
+            "Empty blocks are skipped.")
+
+    def test_parallel_running_sum_large_integers(self):
+        """Test a list whose running sums do not fit in an int64."""
+
+        argument = [2**62, 2**62, 1, 2**70]
+        expected = [2**62, 2**63, 2**63 + 1, 2**70 + 2**63 + 1]
+        sums.parallel_running_sum(argument, n_jobs=2)
+        self.assertEqual(expected, argument,
+            "Large integers are summed exactly.")
+
+    def test_parallel_running_sum_ndarray(self):
+        """Test the parallel running sum of a large integer array."""
+
+        argument = np.arange(-50000, 50000)
+        expected = np.cumsum(argument)
+        sums.parallel_running_sum(argument, n_jobs=4)
+        self.assertTrue(np.array_equal(expected, argument),
+            "The array is summed in place.")
+
 unittest.main()
\ No newline at end of file